@@ -1,7 +1,9 @@
+import functools
 import os
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from sqlalchemy.engine.base import Engine
 
 
@@ -14,20 +16,37 @@ def get_package_dbpath() -> str:
 
 
 def get_engine(dbpath: str = None, read_only: bool = True) -> Engine:
-    """Return the db engine"""
+    """Return the db engine
+
+    The engine is created once for every database path and mode and reused
+    afterwards. Connections are not pooled, so a session that is never
+    closed cannot exhaust a shared pool.
+    """
     if not dbpath:
         dbpath = get_package_dbpath()
+    return _get_engine(dbpath, read_only)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_engine(dbpath: str, read_only: bool) -> Engine:
     if read_only:
         connectstr = "sqlite:///file:{path:s}?mode=ro&nolock=1&uri=true".format(
             path=dbpath
         )
     else:
         connectstr = "sqlite:///{path:s}".format(path=dbpath)
-    return create_engine(connectstr, echo=False)
+    return create_engine(connectstr, echo=False, poolclass=NullPool)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sessionmaker(dbpath: str, read_only: bool) -> sessionmaker:
+    engine = get_engine(dbpath=dbpath, read_only=read_only)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
 
 def get_session(dbpath: str = None, read_only: bool = True) -> Session:
     """Return the database session connection."""
-    engine = get_engine(dbpath=dbpath, read_only=read_only)
-    db_session = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    if not dbpath:
+        dbpath = get_package_dbpath()
+    db_session = _get_sessionmaker(dbpath, read_only)
     return db_session()
@@ -233,16 +233,17 @@ class ElectronicConfiguration(object):
         if wrt.lower() == "order":
             return list(self.conf.items())[-1]
         elif wrt.lower() == "aufbau":
-            return sorted(
+            return max(
                 self.conf.items(), key=lambda x: (x[0][0] + get_l(x[0][1]), x[0][0])
-            )[-1]
+            )
         else:
             raise ValueError(f"wrong <wrt>: {wrt}")
 
     def nvalence(self, block: str, period: int, method: str = None) -> int:
         "Return the number of valence electrons"
         if block in {"s", "p"}:
-            return sum(v for k, v in self.conf.items() if k[0] == self.max_n())
+            max_n = self.max_n()
+            return sum(v for k, v in self.conf.items() if k[0] == max_n)
         elif block == "d":
             if method == "simple":
                 return 2
@@ -261,7 +262,7 @@ class ElectronicConfiguration(object):
 
     def ne(self) -> int:
         "Number of electrons"
-        return sum(list(self.conf.values()))
+        return sum(self.conf.values())
 
     def unpaired_electrons(self) -> int:
         "Number of unpaired electrons"
@@ -342,27 +343,36 @@ class ElectronicConfiguration(object):
 
         ne = 0 if alle else 1
         coeff = 0.3 if n == 1 else 0.35
+        vale = n1 = n2 = 0
         if o in {"s", "p"}:
-            # get the number of valence electrons - 1
-            vale = float(
-                sum(v for k, v in self.conf.items() if k[0] == n and k[1] in ["s", "p"])
-                - ne
-            )
-            n1 = sum(v * 0.85 for k, v in self.conf.items() if k[0] == n - 1)
-            n2 = sum(float(v) for k, v in self.conf.items() if k[0] in range(1, n - 1))
+            # single pass over the subshells: valence shell (s and p only),
+            # n - 1 shell and all the shells below it
+            for (shell, subshell), occ in self.conf.items():
+                if shell == n:
+                    if subshell in {"s", "p"}:
+                        vale += occ
+                elif shell == n - 1:
+                    n1 += occ * 0.85
+                elif 1 <= shell < n - 1:
+                    n2 += occ
 
         elif o in {"d", "f"}:
-            # get the number of valence electrons - 1
-            vale = float(
-                sum(v for k, v in self.conf.items() if k[0] == n and k[1] == o) - ne
-            )
-
-            n1 = sum(float(v) for k, v in self.conf.items() if k[0] == n and k[1] != o)
-            n2 = sum(float(v) for k, v in self.conf.items() if k[0] in range(1, n))
+            # single pass over the subshells: the same subshell, other
+            # subshells of the valence shell and all the inner shells
+            for (shell, subshell), occ in self.conf.items():
+                if shell == n:
+                    if subshell == o:
+                        vale += occ
+                    else:
+                        n1 += occ
+                elif 1 <= shell < n:
+                    n2 += occ
 
         else:
             raise ValueError("wrong valence subshell: ", o)
 
+        # get the number of valence electrons - 1
+        vale = float(vale - ne)
         return n1 + n2 + vale * coeff
 
     def to_str(self) -> str:
@@ -14,53 +14,64 @@ from .utils import n_effective
 RY = 13.605693009
 
 
-def allred_rochow(zeff: float, radius: float) -> float:
+def allred_rochow(
+    zeff: Union[float, np.ndarray], radius: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate the electronegativity of an atom according to the definition
     of Allred and Rochow
 
     Args:
-        zeff: effective nuclear charge
-        radius: value of the radius
+        zeff: effective nuclear charge, scalar or array
+        radius: value of the radius, scalar or array
     """
 
-    return zeff / math.pow(radius, 2)
+    return zeff / radius**2
 
 
-def cottrell_sutton(zeff: float, radius: float) -> float:
+def cottrell_sutton(
+    zeff: Union[float, np.ndarray], radius: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate the electronegativity of an atom according to the definition
     of Allred and Rochow
 
     Args:
-        zeff: effective nuclear charge
-        radius: value of the radius
+        zeff: effective nuclear charge, scalar or array
+        radius: value of the radius, scalar or array
     """
 
-    return math.sqrt(zeff / radius)
+    ratio = zeff / radius
+    if isinstance(ratio, np.ndarray):
+        return np.sqrt(ratio)
+    return math.sqrt(ratio)
 
 
-def gordy(zeff: float, radius: float) -> float:
+def gordy(
+    zeff: Union[float, np.ndarray], radius: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate the electronegativity of an atom according to the definition
     of Allred and Rochow
 
     Args:
-        zeff: effective nuclear charge
-        radius: value of the radius
+        zeff: effective nuclear charge, scalar or array
+        radius: value of the radius, scalar or array
     """
 
     return zeff / radius
 
 
-def li_xue(ionization_energy: float, radius: float, valence_pqn: int) -> float:
+def li_xue(
+    ionization_energy: float, radius: Union[float, np.ndarray], valence_pqn: int
+) -> Union[float, np.ndarray]:
     """
     Calculate the electronegativity of an atom according to the definition
     of Li and Xue
 
     Args:
         charge: Charge of the ion
-        radius: Type of radius to be used in the calculation, either `crystal_radius` as recommended in the paper or `ionic_radius`
+        radius: Type of radius to be used in the calculation, either `crystal_radius` as recommended in the paper or `ionic_radius`, scalar or array
         valence_pqn: valence principal quantum number
     """
 
@@ -79,8 +90,8 @@ def martynov_batsanov(ionization_energies: List[float]) -> float:
     electrons
 
     Args:
-        ionization_energies: ionization energies for the valence electrons
-
+        ionization_energies: ionization energies for the valence electrons,
+            ``nan`` is returned if the sequence is empty
 
     .. math::
 
@@ -92,7 +103,9 @@ def martynov_batsanov(ionization_energies: List[float]) -> float:
     - :math:`I_{k}` is the :math:`k` th ionization potential.
     """
 
-    return np.sqrt(np.array(ionization_energies).mean())
+    if not ionization_energies:
+        return math.nan
+    return math.sqrt(sum(ionization_energies) / len(ionization_energies))
 
 
 def mulliken(
@@ -140,14 +153,17 @@ def nagle(nvalence: int, polarizability: float) -> float:
     return math.pow(nvalence / polarizability, 1.0 / 3.0)
 
 
-def sanderson(radius: float, noble_gas_radius: float) -> float:
+def sanderson(
+    radius: Union[float, np.ndarray], noble_gas_radius: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     r"""
     Calculate Sanderson's electronegativity
 
     Args:
-        radius: radius value for the element
+        radius: radius value for the element, scalar or array
         noble_gas_radius: value of the radius of a hypothetical noble gas with
-        the atomic number of element for which electronegativity is calculated
+        the atomic number of element for which electronegativity is calculated,
+        scalar or array
 
     .. math::
 
@@ -155,7 +171,7 @@ def sanderson(radius: float, noble_gas_radius: float) -> float:
 
     """
 
-    return math.pow(noble_gas_radius / radius, 3)
+    return (noble_gas_radius / radius) ** 3
 
 
 def generic(zeff: float, radius: float, rpow: float = 1, apow: float = 1) -> float:
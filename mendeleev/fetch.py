@@ -1,14 +1,24 @@
-from typing import List, Union
+from typing import Any, Iterator, List, Tuple, Union
+from operator import attrgetter
+import functools
 
+import numpy as np
 import pandas as pd
-from sqlalchemy.dialects import sqlite
 from sqlalchemy import text
+from sqlalchemy.engine.base import Engine
 
-from mendeleev import element
+from mendeleev import element, get_all_elements
 from mendeleev import __version__ as version
 
-from .db import get_engine, get_session
-from .models import Element, IonizationEnergy
+from .db import get_engine
+from .electronegativity import allred_rochow, cottrell_sutton, gordy, sanderson
+from .models import Base, Element, estimate_from_group
+
+
+_IONIZATION_ENERGIES_SQL = (
+    "SELECT atomic_number, degree, energy FROM ionizationenergies "
+    "WHERE degree IN ({placeholders})"
+)
 
 
 def get_zeff(an, method: str = "slater") -> float:
@@ -27,16 +37,29 @@ def get_zeff(an, method: str = "slater") -> float:
     return e.zeff(method=method)
 
 
-def fetch_table(table: str, **kwargs) -> pd.DataFrame:
+def fetch_table(
+    table: str, columns: List[str] = None, **kwargs
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Return a table from the database as :py:class:`pandas.DataFrame`
 
+    Results of calls without extra keyword arguments are cached per table and
+    a copy is returned, so the returned frame can be safely modified.
+
     Args:
         table: Name of the table from the database
-        kwargs: A dictionary of keyword arguments to pass to the :py:func:`pandas.read_qsl`
+        columns: Names of the columns to read, defaults to all columns, must not
+            be empty
+        kwargs: A dictionary of keyword arguments to pass to the
+            :py:func:`pandas.read_sql_query`, e.g. `chunksize` to iterate over
+            large tables in chunks or, with pandas 2.0 or newer and the
+            optional `pyarrow` package installed, `dtype_backend="pyarrow"`
+            for Arrow backed columns
 
     Returns:
-        df (pandas.DataFrame): Pandas DataFrame with the contents of the table
+        df (pandas.DataFrame): Pandas DataFrame with the contents of the table,
+            an iterator over DataFrames with at most `chunksize` rows if
+            `chunksize` is given
 
     Example:
         >>> from mendeleev.fetch import fetch_table
@@ -44,6 +67,17 @@ def fetch_table(table: str, **kwargs) -> pd.DataFrame:
         >>> type(df)
         pandas.core.frame.DataFrame
 
+        Large tables can be read in chunks
+
+        >>> chunks = fetch_table('ionizationenergies', chunksize=1000)
+        >>> sum(len(chunk) for chunk in chunks)
+        5837
+
+        Arrow backed columns can be requested for large tables, this requires
+        `pyarrow`
+
+        >>> df = fetch_table('ionizationenergies', dtype_backend='pyarrow')  # doctest: +SKIP
+
     """
 
     tables = {
@@ -65,50 +99,167 @@ def fetch_table(table: str, **kwargs) -> pd.DataFrame:
             f"Table '{table}' not found, available tables are: {', '.join(sorted(tables))}"
         )
 
+    if columns is not None:
+        if not columns:
+            raise ValueError("columns must contain at least one column name")
+        available = Base.metadata.tables[table].columns.keys()
+        missing = [c for c in columns if c not in available]
+        if missing:
+            raise ValueError(
+                f"Columns {', '.join(missing)} not found in table '{table}', "
+                f"available columns are: {', '.join(sorted(available))}"
+            )
+        columns = tuple(columns)
+
+    if kwargs:
+        return _read_table(table, columns, **kwargs)
+    return _read_table_cached(table, columns).copy()
+
+
+def _read_table(
+    table: str, columns: Tuple[str, ...] = None, **kwargs
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    "Read the `columns` of `table` from the database, all columns if `None`"
     engine = get_engine()
-    query = f"SELECT * FROM {table}"
+    selected = "*" if columns is None else ", ".join(columns)
+    query = f"SELECT {selected} FROM {table}"
+    if kwargs.get("chunksize") is not None:
+        return _iter_table_chunks(engine, query, **kwargs)
     with engine.begin() as conn:
         return pd.read_sql_query(sql=text(query), con=conn, **kwargs)
 
 
-def fetch_electronegativities(scales: List[str] = None) -> pd.DataFrame:
+def _iter_table_chunks(engine: Engine, query: str, **kwargs) -> Iterator[pd.DataFrame]:
+    "Yield the chunks of `query`, the connection stays open until the last one"
+    with engine.begin() as conn:
+        yield from pd.read_sql_query(sql=text(query), con=conn, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_table_cached(table: str, columns: Tuple[str, ...] = None) -> pd.DataFrame:
+    "Cached version of :py:func:`_read_table`, do not modify the returned frame"
+    return _read_table(table, columns)
+
+
+@functools.lru_cache(maxsize=1)
+def _all_elements_cached() -> Tuple[Element, ...]:
+    "Load all elements once, the elements are treated as read only"
+    return tuple(sorted(get_all_elements(), key=attrgetter("atomic_number")))
+
+
+def _all_elements() -> List[Element]:
+    "Return a list of all elements ordered by atomic number"
+    return list(_all_elements_cached())
+
+
+def _execute_raw(
+    engine: Engine, sql: str, params: Tuple[Any, ...] = ()
+) -> List[Tuple[Any, ...]]:
+    """
+    Execute a query directly on the DBAPI connection skipping the SQLAlchemy
+    result processing
+
+    Args:
+        engine: database engine
+        sql: SQL query using the `?` placeholders for parameters
+        params: parameters of the query
+
+    Returns:
+        rows (list): rows of the result as tuples
+    """
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    finally:
+        conn.close()
+    return rows
+
+
+def fetch_electronegativities(
+    scales: List[str] = None, elems: List[Element] = None
+) -> pd.DataFrame:
     """
     Fetch electronegativity scales for all elements as :py:class:`pandas.DataFrame`
 
     Args:
         scales: list of scale names, defaults to all available scales
+        elems: list of all elements, if not given they are loaded from the database
 
     Returns:
         df (pandas.DataFrame): Pandas DataFrame with the contents of the table
     """
 
-    session = get_session()
-    engine = get_engine()
+    if elems is None:
+        elems = _all_elements()
+    elems = sorted(elems, key=attrgetter("atomic_number"))
+
+    if scales is None:
+        scales = [
+            "allen",
+            "allred-rochow",
+            "cottrell-sutton",
+            "ghosh",
+            "gordy",
+            "li-xue",
+            "martynov-batsanov",
+            "mulliken",
+            "nagle",
+            "pauling",
+            "sanderson",
+        ]
 
-    query = session.query(Element.atomic_number).order_by("atomic_number")
-    df = pd.read_sql_query(query.statement.compile(dialect=sqlite.dialect()), engine)
-
-    scales = [
-        "allen",
-        "allred-rochow",
-        "cottrell-sutton",
-        "ghosh",
-        "gordy",
-        "li-xue",
-        "martynov-batsanov",
-        "mulliken",
-        "nagle",
-        "pauling",
-        "sanderson",
-    ]
+    available = Element._EN_SCALE_NAMES
+    unknown = [scale for scale in scales if scale not in available]
+    if unknown:
+        raise ValueError(
+            f"scales: {', '.join(unknown)} not found, available scales are: "
+            f"{', '.join(available)}"
+        )
 
+    # scales computed from the effective charge and the default radius
+    radius_scales = {
+        "allred-rochow": allred_rochow,
+        "cottrell-sutton": cottrell_sutton,
+        "gordy": gordy,
+    }
+    atomic_numbers = np.fromiter(
+        (e.atomic_number for e in elems), dtype=int, count=len(elems)
+    )
+    if any(scale in radius_scales or scale == "sanderson" for scale in scales):
+        radius = np.fromiter(
+            (_none_to_nan(e.covalent_radius_pyykko) for e in elems),
+            dtype=float,
+            count=len(elems),
+        )
+    if any(scale in radius_scales for scale in scales):
+        zeff = np.fromiter(
+            (_none_to_nan(e.zeff()) for e in elems), dtype=float, count=len(elems)
+        )
+
+    values = {}
     for scale in scales:
         scale_name = "-".join(s.capitalize() for s in scale.split("-"))
-        df.loc[:, scale_name] = [
-            element(int(row.atomic_number)).electronegativity(scale=scale)
-            for _, row in df.iterrows()
-        ]
-    return df.set_index("atomic_number")
+        if scale in radius_scales:
+            values[scale_name] = radius_scales[scale](zeff, radius)
+            continue
+        if scale == "sanderson":
+            # radii of hypothetical noble gases for all elements at once
+            noble_gas_radius = estimate_from_group(
+                atomic_numbers, "covalent_radius_pyykko"
+            )
+            values[scale_name] = sanderson(radius, noble_gas_radius)
+            continue
+        ens = (e.electronegativity(scale=scale) for e in elems)
+        if scale == "li-xue":
+            # values are dicts keyed by coordination and spin
+            values[scale_name] = list(ens)
+        else:
+            values[scale_name] = np.fromiter(
+                (_none_to_nan(en) for en in ens), dtype=float, count=len(elems)
+            )
+    return pd.DataFrame(values, index=pd.Index(atomic_numbers, name="atomic_number"))
 
 
 def fetch_ionization_energies(degree: Union[List[int], int] = 1) -> pd.DataFrame:
@@ -138,28 +289,29 @@ def fetch_ionization_energies(degree: Union[List[int], int] = 1) -> pd.DataFrame
             f"degree should be either a positive int or a collection of positive ints, got: {degree}"
         )
 
-    session = get_session()
-    engine = get_engine()
-
-    query = session.query(Element.atomic_number).order_by("atomic_number")
-    df = pd.read_sql_query(query.statement.compile(dialect=sqlite.dialect()), engine)
+    # atomic numbers of all elements are cached after the first call
+    atomic_numbers = np.sort(
+        _read_table_cached("elements", ("atomic_number",))["atomic_number"].to_numpy()
+    )
 
-    for d in degree:
-        query = session.query(IonizationEnergy).filter(IonizationEnergy.degree == d)
-        energies = pd.read_sql_query(
-            query.statement.compile(dialect=sqlite.dialect()), engine
-        )
+    placeholders = ", ".join("?" for _ in degree)
+    rows = _execute_raw(
+        get_engine(),
+        _IONIZATION_ENERGIES_SQL.format(placeholders=placeholders),
+        tuple(degree),
+    )
 
-        df = pd.merge(
-            df,
-            energies.loc[:, ["atomic_number", "energy"]].rename(
-                columns={"energy": "IE{0:d}".format(d)}
-            ),
-            on="atomic_number",
-            how="left",
-        )
+    row_index = {z: i for i, z in enumerate(atomic_numbers)}
+    col_index = {d: j for j, d in enumerate(dict.fromkeys(degree))}
+    energies = np.full((len(row_index), len(col_index)), np.nan)
+    for atomic_number, d, energy in rows:
+        energies[row_index[atomic_number], col_index[d]] = _none_to_nan(energy)
 
-    return df.set_index("atomic_number")
+    return pd.DataFrame(
+        energies,
+        index=pd.Index(atomic_numbers, name="atomic_number"),
+        columns=[f"IE{d:d}" for d in col_index],
+    )
 
 
 def fetch_neutral_data() -> pd.DataFrame:
@@ -170,49 +322,77 @@ def fetch_neutral_data() -> pd.DataFrame:
     elements = fetch_table("elements")
     series = fetch_table("series")
     groups = fetch_table("groups")
+    ies = fetch_ionization_energies(degree=1)
+    elems = _all_elements()
+    ens = fetch_electronegativities(elems=elems)
+    props = _collect_element_properties(elems)
 
-    elements = pd.merge(
-        elements,
-        series,
-        left_on="series_id",
-        right_on="id",
-        how="left",
-        suffixes=("", "_series"),
-    )
-    elements = pd.merge(
-        elements,
-        groups,
-        left_on="group_id",
-        right_on="group_id",
-        how="left",
-        suffixes=("", "_group"),
+    # unique keys make the joins below many-to-one
+    series = series.set_index("id", drop=False, verify_integrity=True)
+    groups = groups.set_index("group_id", verify_integrity=True)
+
+    elements = elements.join(series, on="series_id", rsuffix="_series").join(
+        groups, on="group_id", rsuffix="_group"
     )
 
     elements.rename(columns={"color": "series_colors"}, inplace=True)
 
-    for attr in ["hardness", "softness"]:
-        elements[attr] = [
-            getattr(element(row.symbol), attr)() for _, row in elements.iterrows()
-        ]
-
-    elements["mass"] = [
-        element(row.symbol).mass_str() for _, row in elements.iterrows()
-    ]
-
-    elements.loc[:, "zeff_slater"] = elements.apply(
-        lambda x: get_zeff(x["atomic_number"], method="slater"), axis=1
+    # absolute hardness and softness of the neutral atoms, see
+    # Element.hardness and Element.softness
+    ea = elements.set_index("atomic_number")["electron_affinity"]
+    hardness = (ies["IE1"] - ea) * 0.5
+    props = pd.concat(
+        [
+            hardness.rename("hardness"),
+            (1.0 / (2.0 * hardness)).rename("softness"),
+            props,
+        ],
+        axis=1,
     )
-    elements.loc[:, "zeff_clementi"] = elements.apply(
-        lambda x: get_zeff(x["atomic_number"], method="clementi"), axis=1
+
+    return (
+        elements.join(props, on="atomic_number")
+        .join(ens, on="atomic_number")
+        .join(ies, on="atomic_number")
     )
 
-    ens = fetch_electronegativities()
-    elements = pd.merge(elements, ens.reset_index(), on="atomic_number", how="left")
 
-    ies = fetch_ionization_energies(degree=1)
-    elements = pd.merge(elements, ies.reset_index(), on="atomic_number", how="left")
+def _collect_element_properties(elems: List[Element]) -> pd.DataFrame:
+    """
+    Compute the derived properties of elements in a single pass over `elems`
 
-    return elements
+    Args:
+        elems: list of elements
+
+    Returns:
+        df (pandas.DataFrame): mass string and effective nuclear charges
+            indexed by atomic number
+    """
+    n = len(elems)
+    atomic_numbers = np.empty(n, dtype=int)
+    mass = np.empty(n, dtype=object)
+    zeff_slater = np.empty(n, dtype=float)
+    zeff_clementi = np.empty(n, dtype=float)
+
+    for i, e in enumerate(elems):
+        atomic_numbers[i] = e.atomic_number
+        mass[i] = e.mass_str()
+        zeff_slater[i] = _none_to_nan(e.zeff(method="slater"))
+        zeff_clementi[i] = _none_to_nan(e.zeff(method="clementi"))
+
+    return pd.DataFrame(
+        {
+            "mass": mass,
+            "zeff_slater": zeff_slater,
+            "zeff_clementi": zeff_clementi,
+        },
+        index=pd.Index(atomic_numbers, name="atomic_number"),
+    )
+
+
+def _none_to_nan(value: Union[float, None]) -> float:
+    "Replace `None` with `nan` for storing in float arrays"
+    return np.nan if value is None else value
 
 
 def fetch_ionic_radii(radius: str = "ionic_radius") -> pd.DataFrame:
@@ -231,10 +411,13 @@ def fetch_ionic_radii(radius: str = "ionic_radius") -> pd.DataFrame:
             "radius '{radius}', not found, available radii are: 'ionic_radius', 'crystal_radius'"
         )
 
-    ir = fetch_table("ionicradii")
-    return ir.pivot_table(
-        columns="coordination", values=radius, index=["atomic_number", "charge"]
+    ir = fetch_table(
+        "ionicradii", columns=["atomic_number", "charge", "coordination", radius]
     )
+    # ions with both high and low spin radii have two entries for the same
+    # coordination, those are averaged explicitly
+    radii = ir.groupby(["atomic_number", "charge", "coordination"])[radius].mean()
+    return radii.unstack("coordination").dropna(how="all")
 
 
 def add_plot_columns(elements: pd.DataFrame) -> pd.DataFrame:
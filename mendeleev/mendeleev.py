@@ -3,6 +3,7 @@
 from typing import List, Union
 
 import sqlalchemy
+from sqlalchemy.orm import joinedload
 
 from .db import get_session
 from .models import Element, Isotope
@@ -87,6 +88,8 @@ def _get_element(ids) -> Union[Element, List[Element]]:
         raise ValueError("Expecting a <str> or <int>, got: {0:s}".format(type(ids)))
     except sqlalchemy.exc.NoResultFound:
         raise ValueError(f"Element not found: {ids}")
+    finally:
+        session.close()
 
 
 def get_all_elements() -> List[Element]:
@@ -110,24 +113,34 @@ def isotope(symbol_or_atn: Union[str, int], mass_number: int) -> Isotope:
     Returns:
         isotope (Isotope): isotope instance
     """
+    # the session is closed before returning, load everything the isotope's
+    # element needs (e.g. its isotopes for ``mass_number``) up front
+    eager = joinedload(Isotope.element).selectinload(Element.isotopes)
     session = get_session()
-    if isinstance(symbol_or_atn, int):
-        return (
-            session.query(Isotope)
-            .filter_by(atomic_number=symbol_or_atn, mass_number=mass_number)
-            .one()
-        )
-    elif isinstance(symbol_or_atn, str):
-        return (
-            session.query(Isotope)
-            .join(Element)
-            .filter(Element.symbol == symbol_or_atn, Isotope.mass_number == mass_number)
-            .one()
-        )
-    else:
-        raise ValueError(
-            "Expecting a <str> or <int>, got: {0:s}".format(type(symbol_or_atn))
-        )
+    try:
+        if isinstance(symbol_or_atn, int):
+            return (
+                session.query(Isotope)
+                .options(eager)
+                .filter_by(atomic_number=symbol_or_atn, mass_number=mass_number)
+                .one()
+            )
+        elif isinstance(symbol_or_atn, str):
+            return (
+                session.query(Isotope)
+                .options(eager)
+                .join(Element)
+                .filter(
+                    Element.symbol == symbol_or_atn, Isotope.mass_number == mass_number
+                )
+                .one()
+            )
+        else:
+            raise ValueError(
+                "Expecting a <str> or <int>, got: {0:s}".format(type(symbol_or_atn))
+            )
+    finally:
+        session.close()
 
 
 def ids_to_attr(ids, attr: str = "atomic_number"):
@@ -182,6 +195,7 @@ def deltaN(
     e1, e2 = [
         session.query(Element).filter(Element.atomic_number == a).one() for a in atns
     ]
+    session.close()
 
     chi = [
         x.en_mulliken(charge=c, missingIsZero=missingIsZero)
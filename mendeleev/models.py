@@ -3,14 +3,14 @@
 """module defining the database models"""
 
 from typing import Any, Callable, Dict, List, Tuple, Union
-from operator import attrgetter
+from functools import cached_property, lru_cache
 import enum
 import math
 import urllib.parse
 
 import numpy as np
 from sqlalchemy import Column, Boolean, Integer, String, Float, ForeignKey, Text, Enum
-from sqlalchemy.orm import declarative_base, relationship, reconstructor
+from sqlalchemy.orm import declarative_base, lazyload, relationship, reconstructor
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.ext.hybrid import hybrid_property, hybrid_method
 
@@ -43,6 +43,11 @@ __all__ = [
 
 Base = declarative_base()
 
+# column attributes of `Element` left out of the generated hash and equality,
+# see `_generate_element_comparisons`; relationships and caches are never
+# part of them since only mapped columns are compared
+_HASH_EXCLUDE = frozenset(("_series_id",))
+
 
 class Element(Base):
     """
@@ -146,6 +151,21 @@ class Element(Base):
 
     __tablename__ = "elements"
 
+    _EN_SCALES = {
+        "allen": "electronegativity_allen",
+        "allred-rochow": "electronegativity_allred_rochow",
+        "cottrell-sutton": "electronegativity_cottrell_sutton",
+        "ghosh": "electronegativity_ghosh",
+        "gordy": "electronegativity_gordy",
+        "li-xue": "electronegativity_li_xue",
+        "martynov-batsanov": "electronegativity_martynov_batsanov",
+        "mulliken": "electronegativity_mulliken",
+        "nagle": "electronegativity_nagle",
+        "pauling": "electronegativity_pauling",
+        "sanderson": "electronegativity_sanderson",
+    }
+    _EN_SCALE_NAMES = tuple(sorted(_EN_SCALES))
+
     abundance_crust = Column(Float)
     abundance_sea = Column(Float)
     annotation = Column(String)
@@ -184,7 +204,7 @@ class Element(Base):
     glawe_number = Column(Integer)
     goldschmidt_class = Column(String)
     group_id = Column(Integer, ForeignKey("groups.group_id"))
-    group = relationship("Group", uselist=False, lazy="subquery")
+    group = relationship("Group", uselist=False, lazy="selectin")
     heat_of_formation = Column(Float)
     is_monoisotopic = Column(Boolean)
     is_radioactive = Column(Boolean)
@@ -218,14 +238,26 @@ class Element(Base):
     vdw_radius_uff = Column(Float)
     vdw_radius_mm3 = Column(Float)
 
-    _ionization_energies = relationship("IonizationEnergy", lazy="subquery")
-    _oxidation_states = relationship("OxidationState", lazy="subquery")
-    _series = relationship("Series", uselist=False, lazy="subquery")
+    _ionization_energies = relationship(
+        "IonizationEnergy", lazy="selectin", order_by="IonizationEnergy.id"
+    )
+    _oxidation_states = relationship(
+        "OxidationState", lazy="selectin", order_by="OxidationState.id"
+    )
+    _series = relationship("Series", uselist=False, lazy="selectin")
 
-    ionic_radii = relationship("IonicRadius", lazy="subquery")
-    isotopes = relationship("Isotope", lazy="subquery", back_populates="element")
-    phase_transitions = relationship("PhaseTransition", lazy="subquery")
-    screening_constants = relationship("ScreeningConstant", lazy="subquery")
+    ionic_radii = relationship(
+        "IonicRadius", lazy="selectin", order_by="IonicRadius.id"
+    )
+    isotopes = relationship(
+        "Isotope", lazy="selectin", order_by="Isotope.id", back_populates="element"
+    )
+    phase_transitions = relationship(
+        "PhaseTransition", lazy="selectin", order_by="PhaseTransition.id"
+    )
+    screening_constants = relationship(
+        "ScreeningConstant", lazy="selectin", order_by="ScreeningConstant.id"
+    )
 
     @reconstructor
     def init_on_load(self) -> None:
@@ -237,62 +269,86 @@ class Element(Base):
         """Alias for `specific_heat_capacity` for backwards compatibility"""
         return self.specific_heat_capacity
 
-    @hybrid_property
+    @cached_property
+    def _ionenergies_cache(self) -> Dict[int, float]:
+        return {ie.degree: ie.energy for ie in self._ionization_energies}
+
+    @property
     def ionenergies(self) -> Dict[int, float]:
         """
         Return a dict with ionization degree as keys and ionization energies
         in eV as values.
         """
-        return {ie.degree: ie.energy for ie in self._ionization_energies}
+        return self._ionenergies_cache
 
-    @hybrid_property
+    @property
     def oxistates(self) -> List[int]:
         """Return the main oxidation states as a list of integers"""
         return self.oxidation_states()
 
-    @hybrid_property
+    @cached_property
+    def _sconst_cache(self) -> Dict[Tuple[int, str], float]:
+        return {(x.n, x.s): x.screening for x in self.screening_constants}
+
+    @property
     def sconst(self) -> Dict[Tuple[int, int], float]:
         """
         Return a dict with screening constants with tuples (n, s) as keys and
         screening constants as values"""
-        return {(x.n, x.s): x.screening for x in self.screening_constants}
+        return self._sconst_cache
 
-    @hybrid_property
+    @cached_property
+    def _inchi(self) -> str:
+        return f"InchI=1S/{self.symbol}"
+
+    @property
     def inchi(self) -> str:
         """International Chemical Identifier.
 
         See: https://en.wikipedia.org/wiki/International_Chemical_Identifier
         """
-        return f"InchI=1S/{self.symbol}"
+        return self._inchi
 
-    @property
-    def boiling_point(self) -> Union[float, Dict[str, float]]:
-        """Boiling point"""
+    @cached_property
+    def _boiling_point(self) -> Union[float, Dict[str, float]]:
         if len(self.phase_transitions) == 1:
             return self.phase_transitions[0].boiling_point
         else:
             return {pt.allotrope: pt.boiling_point for pt in self.phase_transitions}
 
     @property
-    def melting_point(self) -> Union[float, Dict[str, float]]:
-        """Melting point"""
+    def boiling_point(self) -> Union[float, Dict[str, float]]:
+        """Boiling point"""
+        return self._boiling_point
+
+    @cached_property
+    def _melting_point(self) -> Union[float, Dict[str, float]]:
         if len(self.phase_transitions) == 1:
             return self.phase_transitions[0].melting_point
         else:
             return {pt.allotrope: pt.melting_point for pt in self.phase_transitions}
 
     @property
-    def nist_webbook_url(self) -> str:
-        """URL for the NIST Chemistry WebBook"""
+    def melting_point(self) -> Union[float, Dict[str, float]]:
+        """Melting point"""
+        return self._melting_point
+
+    @cached_property
+    def _nist_webbook_url(self) -> str:
         nist_root_url = "https://webbook.nist.gov/cgi/inchi/"
         return nist_root_url + urllib.parse.quote(self.inchi)
 
+    @property
+    def nist_webbook_url(self) -> str:
+        """URL for the NIST Chemistry WebBook"""
+        return self._nist_webbook_url
+
     @hybrid_property
     def electrons(self) -> int:
         """Return the number of electrons."""
         return self.atomic_number
 
-    @hybrid_property
+    @property
     def neutrons(self) -> int:
         """
         Return the number of neutrons of the most abundant natural stable
@@ -312,35 +368,45 @@ class Element(Base):
         """
         return self.atomic_weight
 
-    @hybrid_property
+    @cached_property
+    def _mass_number(self) -> int:
+        if len(self.isotopes) <= 0:
+            return int(self.atomic_weight)
+
+        # compare (abundance, mass_number) pairs so ties resolve to the
+        # heavier isotope without comparing Isotope objects
+        most_abundant = max(
+            (
+                (i.abundance, i.mass_number)
+                for i in self.isotopes
+                if i.abundance is not None
+            ),
+            default=None,
+        )
+        if most_abundant is not None:
+            return most_abundant[1]
+        return self.isotopes[0].mass_number
+
+    @property
     def mass_number(self) -> int:
         """
         Return the mass number of the most abundant natural stable isotope
         """
-        if len(self.isotopes) <= 0:
-            return int(self.atomic_weight)
-
-        lwithabu = [i for i in self.isotopes if i.abundance is not None]
-        if lwithabu:
-            return max(lwithabu, key=attrgetter("abundance")).mass_number
-        else:
-            return self.isotopes[0].mass_number
+        return self._mass_number
 
     def mass_str(self) -> str:
         """String representation of atomic weight"""
 
         if self.atomic_weight_uncertainty is None:
             if self.is_radioactive:
-                return "[{aw:.0f}]".format(aw=self.atomic_weight)
-            return "{aw:.3f}".format(aw=self.atomic_weight)
+                return f"[{self.atomic_weight:.0f}]"
+            return f"{self.atomic_weight:.3f}"
         else:
-            dec = np.abs(
-                np.floor(np.log10(np.abs(self.atomic_weight_uncertainty)))
-            ).astype(int)
+            dec = int(abs(math.floor(math.log10(abs(self.atomic_weight_uncertainty)))))
             dec = min(dec, 5)
             if self.is_radioactive:
-                return "[{aw:.{dec}f}]".format(aw=self.atomic_weight, dec=dec)
-            return "{aw:.{dec}f}".format(aw=self.atomic_weight, dec=dec)
+                return f"[{self.atomic_weight:.{dec}f}]"
+            return f"{self.atomic_weight:.{dec}f}"
 
     @hybrid_property
     def covalent_radius(self) -> float:
@@ -422,14 +488,24 @@ class Element(Base):
                 f"got {category}, but allowed values are: 'main', 'extended', 'all'"
             )
 
-        if category == "all":
-            return [o.oxidation_state for o in self._oxidation_states]
-        else:
-            return [
-                o.oxidation_state
-                for o in self._oxidation_states
-                if o.category == category
-            ]
+        return list(self._oxidation_states_by_category[category])
+
+    @cached_property
+    def _oxidation_states_by_category(self) -> Dict[str, Tuple[int, ...]]:
+        buckets = {"main": [], "extended": [], "all": []}
+        for o in self._oxidation_states:
+            state = o.oxidation_state
+            buckets["all"].append(state)
+            buckets[o.category].append(state)
+        return {category: tuple(states) for category, states in buckets.items()}
+
+    @cached_property
+    def _max_l_subshells(self) -> Dict[int, str]:
+        "Subshell label with the highest `l` for every occupied shell `n`"
+        max_l = {}
+        for n, subshell in self.ec.conf.keys():
+            max_l[n] = max(max_l.get(n, 0), get_l(subshell))
+        return {n: ORBITALS[ll] for n, ll in max_l.items()}
 
     def zeff(
         self, n: int = None, o: str = None, method: str = "slater", alle: bool = False
@@ -468,7 +544,9 @@ class Element(Base):
 
         if o is None:
             # take the shell with max `l` for a given `n`
-            o = ORBITALS[max(get_l(x[1]) for x in self.ec.conf.keys() if x[0] == n)]
+            o = self._max_l_subshells.get(n)
+            if o is None:
+                raise ValueError(f"no occupied subshells with n={n}")
         elif o not in ORBITALS:
             raise ValueError(f'<s> should be one of {", ".join(ORBITALS)}')
 
@@ -494,38 +572,25 @@ class Element(Base):
         ip = self.ionenergies.get(1, None)
         ea = self.electron_affinity
 
-        if ip is not None and ea is not None:
-            return (ip + ea) ** 2 / (8.0 * (ip - ea))
-        else:
+        if ip is None or ea is None or ip == ea:
             return None
 
+        ip_ea = ip + ea
+        return ip_ea * ip_ea / (8.0 * (ip - ea))
+
     def electronegativity_scales(self, name: str = None) -> Union[Callable, List[str]]:
         # sourcery skip: assign-if-exp
         "Available electronegativity scales"
 
-        scales = {
-            "allen": self.electronegativity_allen,
-            "allred-rochow": self.electronegativity_allred_rochow,
-            "cottrell-sutton": self.electronegativity_cottrell_sutton,
-            "ghosh": self.electronegativity_ghosh,
-            "gordy": self.electronegativity_gordy,
-            "li-xue": self.electronegativity_li_xue,
-            "martynov-batsanov": self.electronegativity_martynov_batsanov,
-            "mulliken": self.electronegativity_mulliken,
-            "nagle": self.electronegativity_nagle,
-            "pauling": self.electronegativity_pauling,
-            "sanderson": self.electronegativity_sanderson,
-        }
-
         if name:
-            if name in scales:
-                return scales[name]
+            if name in self._EN_SCALES:
+                return getattr(self, self._EN_SCALES[name])
             else:
                 raise ValueError(
-                    f"scale: '{name}' not found, available scales are: {', '.join(scales.keys())}"
+                    f"scale: '{name}' not found, available scales are: {', '.join(self._EN_SCALES.keys())}"
                 )
 
-        return list(sorted(scales.keys()))
+        return list(self._EN_SCALE_NAMES)
 
     def electronegativity(self, scale: str = "pauling", **kwargs) -> float:
         """
@@ -587,15 +652,20 @@ class Element(Base):
 
         ie = self.ionenergies.get(charge, None)
 
-        radii = [
-            (ir.coordination, ir.spin, getattr(ir, radius))
-            for ir in self.ionic_radii
-            if ir.charge == charge
-        ]
+        ionic_radii = [ir for ir in self.ionic_radii if ir.charge == charge]
+        if not ionic_radii:
+            return {}
+
+        radii = np.fromiter(
+            (getattr(ir, radius) for ir in ionic_radii),
+            dtype=float,
+            count=len(ionic_radii),
+        )
+        values = li_xue(ie, radii, self.ec.max_n())
 
         return {
-            (coordination_number, spin): li_xue(ie, crystal_radius, self.ec.max_n())
-            for coordination_number, spin, crystal_radius in radii
+            (ir.coordination, ir.spin): value
+            for ir, value in zip(ionic_radii, values.tolist())
         }
 
     def electronegativity_martynov_batsanov(self) -> float:
@@ -688,39 +758,47 @@ class Element(Base):
         """
         Return a list of possible oxides based on the oxidation number
         """
-        oxide_coeffs = [coeffs(ox) for ox in self.oxistates if ox > 0]
-        # convert to strings and replace 1 with empty string
-        normal_coeffs = [[str(c) if c != 1 else "" for c in t] for t in oxide_coeffs]
-        return [f"{self.symbol}{cme}O{co}" for cme, co in normal_coeffs]
+        return list(self._oxides)
+
+    @cached_property
+    def _oxides(self) -> Tuple[str, ...]:
+        symbol = self.symbol
+        oxides = []
+        for ox in self._oxidation_states_by_category["main"]:
+            if ox > 0:
+                cme, co = coeffs(ox)
+                # coefficients equal to 1 are omitted
+                oxides.append(
+                    f"{symbol}{cme if cme != 1 else ''}O{co if co != 1 else ''}"
+                )
+        return tuple(oxides)
+
+    @cached_property
+    def _hash_cache(self) -> int:
+        return self._hash_columns()
 
     def __hash__(self) -> int:
         """Custom has function to allow comparisons
 
         This drops allt he nested, related objects since SQLAlchemy use a custom
-        unhashable `InstrumentedList`.
+        unhashable `InstrumentedList`. The hash is computed once per instance.
         """
-        to_drop = [
-            "_ionization_energies",
-            "_oxidation_states",
-            "_sa_instance_state",
-            "_series",
-            "_series_id",
-            "ec",
-            "group",
-            "ionic_radii",
-            "isotopes",
-            "screening_constants",
-            "phase_transitions",
-        ]
-        hashable = [(k, v) for k, v in self.__dict__.items() if k not in to_drop]
-        return hash(tuple(sorted(hashable)))
+        return self._hash_cache
 
     def __eq__(self, other) -> bool:
-        """Overwrite the defalt comparison"""
-        return hash(self) == hash(other)
+        """Overwrite the defalt comparison
+
+        Two elements are equal when all the attributes that enter the hash
+        are equal.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Element):
+            return NotImplemented
+        return self._columns_equal(other)
 
     def __str__(self) -> str:
-        return "{0} {1} {2}".format(self.atomic_number, self.symbol, self.name)
+        return f"{self.atomic_number} {self.symbol} {self.name}"
 
     def __repr__(self) -> str:
         return "%s(\n%s)" % (
@@ -733,6 +811,37 @@ class Element(Base):
         )
 
 
+def _generate_element_comparisons() -> None:
+    """
+    Generate the methods hashing and comparing the column attributes of
+    `Element`.
+
+    The attributes are spelled out in the generated source so that neither
+    method loops over the attribute names on every call.
+    """
+    fields = [
+        key for key in Element.__mapper__.columns.keys() if key not in _HASH_EXCLUDE
+    ]
+    # compare the primary key first, it tells different elements apart
+    fields.sort(key=lambda field: field != "atomic_number")
+    values = "".join(f"self.{field}, " for field in fields)
+    comparisons = " and ".join(f"self.{field} == other.{field}" for field in fields)
+    source = (
+        "def _hash_columns(self):\n"
+        f"    return hash(({values}))\n"
+        "\n"
+        "def _columns_equal(self, other):\n"
+        f"    return {comparisons}\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    Element._hash_columns = namespace["_hash_columns"]
+    Element._columns_equal = namespace["_columns_equal"]
+
+
+_generate_element_comparisons()
+
+
 class ValueOrigin(enum.Enum):
     "Options for the origin of the property value."
 
@@ -793,51 +902,75 @@ def fetch_attrs_for_group(attrs: List[str], group: int = 18) -> Tuple[List[Any]]
         data (dict): Dictionary with noble gas atomic numbers as keys and values of the
             `attr` as values
     """
+    results = _fetch_attrs_for_group_cached(tuple(attrs), group)
+    return tuple(list(values) for values in results)
+
+
+@lru_cache(maxsize=None)
+def _fetch_attrs_for_group_cached(
+    attrs: Tuple[str, ...], group: int
+) -> Tuple[Tuple[Any, ...], ...]:
+    "Query the group members once per `(attrs, group)` combination"
     session = get_session()
+    # related objects are loaded only when one of the attributes needs them
     members = (
         session.query(Element)
+        .options(lazyload("*"))
         .filter(Element.group_id == group)
         .order_by(Element.atomic_number)
         .all()
     )
 
-    results = tuple([getattr(member, attr) for member in members] for attr in attrs)
+    results = tuple(
+        tuple(getattr(member, attr) for member in members) for attr in attrs
+    )
     session.close()
     return results
 
 
 def estimate_from_group(
     atomic_number, attr_name, group: int = 18, deg: int = 1
-) -> float:
+) -> Union[float, np.ndarray]:
     """
     Evaluate a value `attribute` for element by interpolation or
     extrapolation of the data points from elements from `group`.
 
     Args:
-        atomic_number: value for which the property will be evaluated
+        atomic_number: value for which the property will be evaluated,
+            scalar or array
         attr_name: attribute to be estimated
         group: periodic table group number
         deg: degree of the polynomial used in the extrapolation beyond
             the provided data points
     """
-    xref, yref = fetch_attrs_for_group(["atomic_number", attr_name], group=group)
+    xref, yref = _group_reference_arrays(attr_name, group)
 
-    x = atomic_number
-    xref = np.array(xref)
-    yref = np.array(yref)
-    if xref.min() <= x <= xref.max():
-        return np.interp([x], xref, yref)
+    x = np.asarray(atomic_number)
+    values = np.interp(x, xref, yref)
+
+    # extrapolate beyond the data range using the three closest data points
+    for outside, xslice, yslice in (
+        (x < xref[0], xref[:3], yref[:3]),
+        (x > xref[-1], xref[-3:], yref[-3:]),
+    ):
+        if np.any(outside):
+            fn = np.poly1d(np.polyfit(xslice, yslice, deg))
+            values = np.where(outside, fn(x), values)
+
+    return float(values) if values.ndim == 0 else values
 
-    if x < xref.min():
-        xslice = xref[:3]
-        yslice = yref[:3]
-    elif x > xref.max():
-        xslice = xref[-3:]
-        yslice = yref[-3:]
 
-    fit = np.polyfit(xslice, yslice, deg)
-    fn = np.poly1d(fit)
-    return fn(x)
+@lru_cache(maxsize=None)
+def _group_reference_arrays(
+    attr_name: str, group: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    "Atomic numbers and `attr_name` values of the `group` members as arrays"
+    xref, yref = _fetch_attrs_for_group_cached(("atomic_number", attr_name), group)
+    xref = np.array(xref)
+    yref = np.array(yref)
+    xref.flags.writeable = False
+    yref.flags.writeable = False
+    return xref, yref
 
 
 class IonicRadius(Base):
@@ -875,9 +1008,12 @@ class IonicRadius(Base):
     most_reliable = Column(Boolean)
 
     def __str__(self) -> str:
-        out = ["{0}={1:>4d}", "{0}={1:5s}", "{0}={1:>6.3f}", "{0}={1:>6.3f}"]
-        keys = ["charge", "coordination", "crystal_radius", "ionic_radius"]
-        return ", ".join(o.format(k, getattr(self, k)) for o, k in zip(out, keys))
+        return (
+            f"charge={self.charge:>4d}, "
+            f"coordination={self.coordination:5s}, "
+            f"crystal_radius={self.crystal_radius:>6.3f}, "
+            f"ionic_radius={self.ionic_radius:>6.3f}"
+        )
 
     def __repr__(self) -> str:
         return "%s(\n%s)" % (
@@ -909,11 +1045,12 @@ class IonizationEnergy(Base):
     energy = Column(Float)
 
     def __str__(self) -> str:
-        return "{0:5d} {1:10.5f}".format(self.degree, self.energy)
+        return f"{self.degree:5d} {self.energy:10.5f}"
 
     def __repr__(self) -> str:
-        return "<IonizationEnergy(atomic_number={a:5d}, degree={d:3d}, energy={e:10.5f})>".format(
-            a=self.atomic_number, d=self.degree, e=self.energy
+        return (
+            f"<IonizationEnergy(atomic_number={self.atomic_number:5d}, "
+            f"degree={self.degree:3d}, energy={self.energy:10.5f})>"
         )
 
 
@@ -963,7 +1100,7 @@ class Group(Base):
     name = Column(String)
 
     def __repr__(self) -> str:
-        return "<Group(symbol={s:s}, name={n:s})>".format(s=self.symbol, n=self.name)
+        return f"<Group(symbol={self.symbol:s}, name={self.name:s})>"
 
 
 class Series(Base):
@@ -984,7 +1121,7 @@ class Series(Base):
     color = Column(String)
 
     def __repr__(self) -> str:
-        return "<Series(name={n:s}, color={c:s})>".format(n=self.name, c=self.color)
+        return f"<Series(name={self.name:s}, color={self.color:s})>"
 
 
 def with_uncertainty(value: float, uncertainty: float, digits: int = 5) -> str:
@@ -1000,9 +1137,15 @@ def with_uncertainty(value: float, uncertainty: float, digits: int = 5) -> str:
         return "None"
 
     if uncertainty is None or uncertainty == 0.0:
-        return "{0:.{1}f}".format(value, digits)
+        return f"{value:.{digits}f}"
+    return _format_with_uncertainty(value, uncertainty)
+
+
+@lru_cache(maxsize=4096)
+def _format_with_uncertainty(value: float, uncertainty: float) -> str:
+    "Format a value with a nonzero uncertainty, memoized for repeated values"
     digits = -int(math.floor(math.log10(uncertainty)))
-    return "{0:.{2}f}({1:.0f})".format(value, uncertainty * 10**digits, digits)
+    return f"{value:.{digits}f}({uncertainty * 10**digits:.0f})"
 
 
 class Isotope(Base):
@@ -1051,7 +1194,9 @@ class Isotope(Base):
     spin = Column(String)
 
     element = relationship("Element", lazy="joined", back_populates="isotopes")
-    decay_modes = relationship("IsotopeDecayMode", lazy="subquery")
+    decay_modes = relationship(
+        "IsotopeDecayMode", lazy="selectin", order_by="IsotopeDecayMode.id"
+    )
 
     @hybrid_property
     def is_stable(self) -> bool:
@@ -1059,11 +1204,14 @@ class Isotope(Base):
         return not self.is_radioactive
 
     def __str__(self) -> str:
-        return "atomic_number={0:5d}, mass_number={1:5d}, mass={2:10s}, abundance={3:10s}".format(
-            self.atomic_number,
-            self.mass_number,
-            with_uncertainty(self.mass, self.mass_uncertainty, digits=5),
-            with_uncertainty(self.abundance, self.abundance_uncertainty, digits=3),
+        mass = with_uncertainty(self.mass, self.mass_uncertainty, digits=5)
+        abundance = with_uncertainty(
+            self.abundance, self.abundance_uncertainty, digits=3
+        )
+        return (
+            f"atomic_number={self.atomic_number:5d}, "
+            f"mass_number={self.mass_number:5d}, "
+            f"mass={mass:10s}, abundance={abundance:10s}"
         )
 
     def __repr__(self) -> str:
@@ -1141,13 +1289,12 @@ class ScreeningConstant(Base):
     screening = Column(Float)
 
     def __str__(self) -> str:
-        return "{0:4d} {1:3d} {2:s} {3:10.4f}".format(
-            self.atomic_number, self.n, self.s, self.screening
-        )
+        return f"{self.atomic_number:4d} {self.n:3d} {self.s:s} {self.screening:10.4f}"
 
     def __repr__(self) -> str:
-        return "<ScreeningConstant(Z={0:4d}, n={1:3d}, s={2:s}, screening={3:10.4f})>".format(
-            self.atomic_number, self.n, self.s, self.screening
+        return (
+            f"<ScreeningConstant(Z={self.atomic_number:4d}, n={self.n:3d}, "
+            f"s={self.s:s}, screening={self.screening:10.4f})>"
         )
 
 
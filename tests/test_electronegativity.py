@@ -1,7 +1,18 @@
+import math
+
+import numpy as np
 import pytest
 
-from mendeleev import Element
-from mendeleev.electronegativity import mulliken
+from mendeleev import Element, element
+from mendeleev.electronegativity import (
+    allred_rochow,
+    cottrell_sutton,
+    gordy,
+    martynov_batsanov,
+    mulliken,
+    sanderson,
+)
+from mendeleev.models import estimate_from_group
 
 
 def test_scales_exception():
@@ -15,3 +26,42 @@ def test_mulliken():
     assert mulliken(None, 1.0) is None
     assert mulliken(2.0, None) == pytest.approx(1.0)
     assert mulliken(2.0, 1.0) == pytest.approx(1.5)
+
+
+def test_martynov_batsanov():
+    assert martynov_batsanov([4.0, 12.0]) == pytest.approx(math.sqrt(8.0))
+    assert math.isnan(martynov_batsanov([]))
+
+
+def test_estimate_from_group_array_matches_scalar():
+    # 1 and 120 lie outside the atomic numbers of group 18 and are extrapolated
+    atomic_numbers = [1, 10, 50, 119, 120]
+    values = estimate_from_group(np.array(atomic_numbers), "covalent_radius_pyykko")
+    assert isinstance(values, np.ndarray)
+    for z, value in zip(atomic_numbers, values):
+        scalar = estimate_from_group(z, "covalent_radius_pyykko")
+        assert isinstance(scalar, float)
+        assert scalar == pytest.approx(value)
+
+
+@pytest.mark.parametrize("formula", [allred_rochow, cottrell_sutton, gordy])
+def test_zeff_radius_formulas(formula):
+    assert type(formula(2.0, 4.0)) is float
+    with pytest.raises(ZeroDivisionError):
+        formula(2.0, 0.0)
+
+    zeff, radius = np.array([1.0, 2.0]), np.array([4.0, 8.0])
+    values = formula(zeff, radius)
+    assert isinstance(values, np.ndarray)
+    assert values.tolist() == pytest.approx(
+        [formula(z, r) for z, r in zip(zeff.tolist(), radius.tolist())]
+    )
+
+
+def test_sanderson():
+    assert type(sanderson(2.0, 4.0)) is float
+    assert sanderson(2.0, 4.0) == pytest.approx(8.0)
+    assert type(element("Fe").electronegativity(scale="sanderson")) is float
+
+    values = sanderson(np.array([2.0, 4.0]), np.array([4.0, 4.0]))
+    assert values.tolist() == pytest.approx([8.0, 1.0])
@@ -1,4 +1,6 @@
 import pytest
+from sqlalchemy import inspect
+
 from mendeleev import Element, element, get_all_elements
 from mendeleev.db import get_session
 
@@ -72,6 +74,28 @@ def test_electrophilicity(symbol):
     e.electrophilicity()
 
 
+def test_electrophilicity_equal_ip_ea():
+    e = element("Fe")
+    e.electron_affinity = e.ionenergies[1]
+    assert e.electrophilicity() is None
+
+
+def test_detached_element_relationships():
+    # element() closes its session, the relationships have to be loaded
+    e = element("Fe")
+    assert inspect(e).detached
+    assert e.group.symbol == "VIIIB"
+    assert e.series == "Transition metals"
+    assert len(e.isotopes) > 0
+    assert all(isinstance(i.decay_modes, list) for i in e.isotopes)
+    assert e.isotopes[0].element is e
+    assert e.ionenergies[1] == pytest.approx(7.9024678)
+    assert e.oxistates == [2, 3]
+    assert len(e.ionic_radii) > 0
+    assert len(e.screening_constants) > 0
+    assert len(e.phase_transitions) > 0
+
+
 def test__eq__():
     elements = get_all_elements()
     for e in elements:
@@ -28,6 +28,35 @@ def test_fetch_table(table, nrows):
     assert df.shape[0] == nrows
 
 
+def test_fetch_table_columns():
+    df = fetch_table("elements", columns=["atomic_number", "symbol"])
+    assert list(df.columns) == ["atomic_number", "symbol"]
+    assert df.shape[0] == 118
+
+
+def test_fetch_table_unknown_column():
+    with pytest.raises(ValueError):
+        fetch_table("elements", columns=["symbol", "unknown"])
+
+
+def test_fetch_table_no_columns():
+    with pytest.raises(ValueError):
+        fetch_table("elements", columns=[])
+
+
+def test_fetch_table_chunks():
+    chunks = list(fetch_table("elements", columns=["atomic_number"], chunksize=50))
+    assert [len(chunk) for chunk in chunks] == [50, 50, 18]
+    df = pd.concat(chunks, ignore_index=True)
+    assert sorted(df["atomic_number"]) == list(range(1, 119))
+
+
+def test_fetch_table_returns_copy():
+    df = fetch_table("elements")
+    df.drop(columns="symbol", inplace=True)
+    assert "symbol" in fetch_table("elements").columns
+
+
 def test_fetch_neutral_data():
     df = fetch_neutral_data()
     assert isinstance(df, pd.DataFrame)
@@ -52,3 +81,19 @@ def test_fetch_ionization_energies(degree, cols):
 def test_fetch_electronegativities():
     df = fetch_electronegativities()
     assert isinstance(df, pd.DataFrame)
+
+
+def test_fetch_electronegativities_scales():
+    df = fetch_electronegativities(scales=["pauling", "allred-rochow"])
+    assert list(df.columns) == ["Pauling", "Allred-Rochow"]
+
+
+def test_fetch_electronegativities_unknown_scale():
+    with pytest.raises(ValueError):
+        fetch_electronegativities(scales=["pauling", "unknown"])
+
+
+def test_fetch_electronegativities_no_elements():
+    df = fetch_electronegativities(scales=["pauling", "sanderson"], elems=[])
+    assert list(df.columns) == ["Pauling", "Sanderson"]
+    assert df.empty
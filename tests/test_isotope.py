@@ -1,3 +1,5 @@
+from sqlalchemy import inspect
+
 from mendeleev import isotope
 from mendeleev.db import get_session
 from mendeleev.models import Isotope
@@ -14,6 +16,19 @@ def test_get_isotope():
     assert result.mass_number == 3
 
 
+def test_isotope_element_relationships():
+    for result in (isotope("Fe", 56), isotope(26, 56)):
+        # isotope() closes its session, the relationships have to be loaded
+        assert inspect(result).detached
+        assert result.element.symbol == "Fe"
+        assert result.element.group.symbol == "VIIIB"
+        assert result.element.series == "Transition metals"
+        assert all(isinstance(i.decay_modes, list) for i in result.element.isotopes)
+        assert result.element.mass_number == 56
+        assert len(result.element.isotopes) > 0
+        assert result.element.neutrons == 30
+
+
 def test_isotopes_half_life_units():
     reference_units = (
         None,